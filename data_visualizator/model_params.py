@@ -1,9 +1,28 @@
-from copy import deepcopy
-from trycast import isassignable
+from types import NoneType
+from typing import Callable, get_args
 
 from .config import ALL_PARAMS, AllParamNames
 
 
+def _make_type_checker(expected_type) -> Callable[[object], bool]:
+    """Строит проверку isinstance для типа вида Optional[...] или обычного типа.
+
+    None проверяется отдельно, поэтому NoneType отбрасывается.
+    int считается допустимым значением для float.
+    """
+    args = get_args(expected_type) or (expected_type,)
+    allowed = tuple(arg for arg in args if arg is not NoneType)
+    if float in allowed:
+        allowed += (int,)
+    return lambda value: isinstance(value, allowed)
+
+
+_TYPE_CHECKERS: dict[str, Callable[[object], bool]] = {
+    param: _make_type_checker(expected_type)
+    for param, expected_type in ALL_PARAMS.items()
+}
+
+
 class ModelParams:
     """
     Класс для хранения параметров модели с их типами.
@@ -21,14 +40,14 @@ class ModelParams:
         positive (Optional[bool]): Флаг, разрешающий только положительные коэффициенты.
     """
 
-    __slots__ = list(ALL_PARAMS.keys())
+    __slots__ = tuple(ALL_PARAMS)
     __annotations__ = ALL_PARAMS
 
     def __init__(self, **kwargs):
         for param, expected_type in self.__annotations__.items():
             value = kwargs.get(param, None)
 
-            if value is not None and not isassignable(value, expected_type):
+            if value is not None and not _TYPE_CHECKERS[param](value):
                 raise TypeError(
                     f"Parameter '{param}' must be of type {expected_type}, got {type(value)}"
                 )
@@ -54,13 +73,20 @@ class ModelParams:
         )
 
     def copy(self):
-        """Возвращает глубокую копию объекта."""
-        return deepcopy(self)
+        """Возвращает копию объекта.
+
+        Все значения параметров неизменяемые (float, int, bool, str, None),
+        поэтому достаточно скопировать слоты без deepcopy и повторной проверки типов.
+        """
+        new = self.__class__.__new__(self.__class__)
+        for param in self.__slots__:
+            setattr(new, param, getattr(self, param))
+        return new
 
     def set_param(self, param: AllParamNames, value):
         """Устанавливает значение параметра."""
         if not hasattr(self, param.value):
             raise ValueError(f"Unknown parameter '{param.value}' for ModelParams")
 
-        if not isassignable(value, self.__annotations__[param.value]):
+        if value is not None and not _TYPE_CHECKERS[param.value](value):
             raise TypeError
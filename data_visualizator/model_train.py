@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Optional
 
 
@@ -18,14 +19,14 @@ class ModelTrainer:
     def set_model(self, model: Optional[SupportedModels]):
         if model is None:
             self.model = None
-            self.needed_params = set()
+            self.needed_params = ()
             return
 
         if not isinstance(model, SupportedModels):
             raise TypeError("Model must be of type SupportedModels or None")
 
         self.model = model
-        self.needed_params = get_params_for_model(self.model)
+        self.needed_params = tuple(get_params_for_model(self.model))
 
     def set_params(self, params: Optional[ModelParams]):
         if params is None:
@@ -44,10 +45,13 @@ class ModelTrainer:
         if self.params is None:
             raise ValueError("Params are not set")
 
+        names = self.needed_params
+        values = attrgetter(*names)(self.params) if names else ()
+        if len(names) == 1:
+            values = (values,)
+
         actual_params = {
-            param: getattr(self.params, param)
-            for param in self.needed_params
-            if getattr(self.params, param) is not None
+            name: value for name, value in zip(names, values) if value is not None
         }
 
         model_class = self.model.value
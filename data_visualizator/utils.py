@@ -1,8 +1,11 @@
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
+from pyarrow import feather
 from .config import AllParamNames, SupportedModels, ModelsSupportedParams
 
 
+@lru_cache(maxsize=None)
 def get_params_for_model(model: SupportedModels) -> set:
     """Возвращает множество поддерживаемых параметров для указанной модели."""
 
@@ -25,15 +28,22 @@ def read_data_file(file_path: str):
     suffix = path.suffix.lower()
 
     if suffix == ".csv":
-        return pd.read_csv(path)
+        # многопоточный парсер pyarrow; файлы, которые он не разобрал,
+        # перечитываются C-движком pandas
+        try:
+            return pd.read_csv(path, engine="pyarrow")
+        except pd.errors.ParserError:
+            return pd.read_csv(path)
     elif suffix in [".xls", ".xlsx"]:
         return pd.read_excel(path)
     elif suffix == ".json":
         return pd.read_json(path)
     elif suffix == ".parquet":
-        return pd.read_parquet(path)
+        # memory_map передается в pyarrow.parquet.read_table
+        return pd.read_parquet(path, engine="pyarrow", memory_map=True)
     elif suffix == ".feather":
-        return pd.read_feather(path)
+        # pd.read_feather не пробрасывает memory_map, поэтому читаем через pyarrow
+        return feather.read_table(str(path), memory_map=True).to_pandas()
     elif suffix in [".h5", ".hdf5"]:
         return pd.read_hdf(path)
     elif suffix == ".pkl":
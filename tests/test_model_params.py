@@ -0,0 +1,53 @@
+import pytest
+
+from data_visualizator.config import AllParamNames
+from data_visualizator.model_params import ModelParams, _make_type_checker
+
+
+def test_model_params_has_no_instance_dict():
+    assert not hasattr(ModelParams(), "__dict__")
+
+
+def test_copy_is_equal_and_independent():
+    params = ModelParams(alpha=0.5, max_iter=100, solver="auto")
+
+    copied = params.copy()
+
+    assert copied == params
+    assert copied is not params
+
+    copied.alpha = 1.0
+    assert params.alpha == 0.5
+
+
+def test_int_is_accepted_for_float_param():
+    params = ModelParams(alpha=1)
+
+    assert params.alpha == 1
+
+
+def test_str_is_rejected_for_float_param():
+    with pytest.raises(TypeError):
+        ModelParams(alpha="1.0")
+
+
+def test_set_param_rejects_wrong_type():
+    params = ModelParams()
+
+    with pytest.raises(TypeError):
+        params.set_param(AllParamNames.max_iter, "100")
+
+
+def test_unknown_param_is_rejected():
+    with pytest.raises(ValueError):
+        ModelParams(unknown=1)
+
+
+def test_type_checker_accepts_plain_types():
+    check_int = _make_type_checker(int)
+    check_float = _make_type_checker(float)
+
+    assert check_int(1)
+    assert not check_int("1")
+    assert check_float(1.5)
+    assert check_float(1)
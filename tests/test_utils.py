@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from data_visualizator.utils import read_data_file
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "data.csv"
+    path.write_text(text)
+    return path
+
+
+def test_read_csv(tmp_path):
+    path = write_csv(tmp_path, "a,b\n1,x\n2,y\n")
+
+    df = read_data_file(str(path))
+
+    assert df.columns.tolist() == ["a", "b"]
+    assert df["a"].tolist() == [1, 2]
+    assert df["b"].tolist() == ["x", "y"]
+
+
+def test_read_csv_quoted_newline_in_header(tmp_path):
+    path = write_csv(tmp_path, '"a\nb",c\n1,2\n')
+
+    df = read_data_file(str(path))
+
+    assert df.columns.tolist() == ["a\nb", "c"]
+    assert df.values.tolist() == [[1, 2]]
+
+
+def test_read_csv_falls_back_to_c_engine(tmp_path):
+    # pyarrow не понимает неявный индекс, C-движок делает его индексом
+    path = write_csv(tmp_path, "a,b\nx,1,2\ny,3,4\n")
+
+    df = read_data_file(str(path))
+
+    assert df.index.tolist() == ["x", "y"]
+    assert df.values.tolist() == [[1, 2], [3, 4]]
+
+
+def test_read_malformed_csv_raises_parser_error(tmp_path):
+    path = write_csv(tmp_path, "a,b\n1,2\n3,4,5,6\n")
+
+    with pytest.raises(pd.errors.ParserError):
+        read_data_file(str(path))
+
+
+def test_read_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_data_file(str(tmp_path / "missing.csv"))
+
+
+def test_read_unsupported_format(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("a,b\n")
+
+    with pytest.raises(ValueError):
+        read_data_file(str(path))